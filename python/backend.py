@@ -5,25 +5,80 @@ Handles Git operations and file management for the Blender addon manager.
 
 import os
 import sys
+import stat
+import copy
+import time
+import asyncio
 import json
 import shutil
+import zipfile
+import tempfile
+import threading
+import fnmatch
 import subprocess
+import http.client
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Any
+import urllib.parse
 import urllib.request
 import urllib.error
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # Configuration
 GITHUB_REPO = "CoreyCorza/scripting_nodes"
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
+GITHUB_CODELOAD_BASE = "https://codeload.github.com"
 ADDON_FOLDER_NAME = "scripting_nodes"
 BACKUP_FOLDER_NAME = "_tmp_serpens_backup"
 SETTINGS_FILE = "serpens_manager_settings.json"
+RESTORE_STAGING_NAME = "_restore_staging"
+RESTORE_PREVIOUS_NAME = "_restore_previous"
+RESTORE_SENTINEL_NAME = "restore_in_progress"
+COPY_BUFFER_SIZE = 1024 * 1024
+DOWNLOAD_BUFFER_SIZE = 256 * 1024
+MAX_FETCH_WORKERS = 16
+BRANCHES_CACHE_FILE = "branches_cache.json"
+RATE_LIMIT_RESERVE = 10
+GITHUB_HEADERS = {
+    "User-Agent": "SerpensDevManager/1.0",
+    "Accept": "application/vnd.github+json",
+}
+SPARSE_EXCLUDE_DIRS = ("tests", "docs")
+# stderr fragments meaning git or the server can't do a partial/sparse clone
+PARTIAL_CLONE_ERRORS = ("filter", "partial clone", "promisor", "sparse-checkout", "no-cone")
+BACKUP_META_FILE = "serpens_backup_meta.json"
+BACKUP_EXCLUDE = (".git", "__pycache__", "*.pyc")
+
+# Resolved once so git calls skip the PATH lookup, None when git isn't installed
+_GIT = shutil.which("git")
+
+# Last git status per addon path: (HEAD/reflog mtimes, branch, commit unix time)
+_status_cache: Dict[str, tuple] = {}
 
+# Per-thread copy buffer, allocated once and reused for every file
+_copy_buffers = threading.local()
 
+# In-process settings cache, invalidated when the file's mtime changes
+_settings_cache: Optional[Dict[str, Any]] = None
+_settings_mtime = 0
+
+
+@lru_cache(maxsize=8)
 def get_blender_addons_path(blender_version: str = "5.0", custom_path: str = "") -> Path:
-    """Get the Blender addons folder path."""
+    """Get the Blender addons folder path (memoized, APPDATA doesn't change at runtime)."""
     if custom_path:
         return Path(custom_path)
     
@@ -52,30 +107,136 @@ def get_settings_path() -> Path:
 
 def load_settings() -> Dict[str, Any]:
     """Load settings from file."""
+    global _settings_cache, _settings_mtime
+    
     settings_path = get_settings_path()
-    if settings_path.exists():
-        with open(settings_path, 'r') as f:
-            return json.load(f)
-    return {
-        "blenderVersion": "5.0",
-        "customPath": "",
-        "autoBackup": True
-    }
+    try:
+        st = settings_path.stat()
+    except FileNotFoundError:
+        return {
+            "blenderVersion": "5.0",
+            "customPath": "",
+            "autoBackup": True,
+            "zipInstall": False
+        }
+    
+    # Reuse the parsed settings if the file hasn't changed since the last read
+    if _settings_cache is not None and st.st_mtime_ns == _settings_mtime:
+        return copy.copy(_settings_cache)
+    
+    with open(settings_path, 'r') as f:
+        settings = json.load(f)
+    
+    _settings_cache = settings
+    _settings_mtime = st.st_mtime_ns
+    return copy.copy(settings)
 
 
 def save_settings(settings: Dict[str, Any]) -> bool:
     """Save settings to file."""
+    global _settings_cache, _settings_mtime
+    
     settings_path = get_settings_path()
+    
+    # Nothing to do if the file on disk already holds these settings
+    if _settings_cache is not None and settings == _settings_cache:
+        try:
+            if settings_path.stat().st_mtime_ns == _settings_mtime:
+                return True
+        except FileNotFoundError:
+            pass
+    
     settings_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(settings_path, 'w') as f:
+    
+    # Write to a temp file and swap it in so readers never see a partial file
+    tmp_path = settings_path.with_suffix(".tmp")
+    with open(tmp_path, 'w') as f:
         json.dump(settings, f, indent=2)
+    os.replace(tmp_path, settings_path)
+    
+    _settings_cache = copy.copy(settings)
+    _settings_mtime = settings_path.stat().st_mtime_ns
     return True
 
 
+def _run_git(args: List[str], cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run a git command and capture its output."""
+    if _GIT is None:
+        raise Exception("Git is not installed or not on PATH")
+    
+    # Keep Windows from flashing a console window for every git call
+    creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+    result = subprocess.run(
+        [_GIT] + args,
+        cwd=str(cwd) if cwd else None,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        creationflags=creationflags
+    )
+    # Decode once here rather than through the locale's text wrapper
+    result.stdout = result.stdout.decode("utf-8", "replace")
+    result.stderr = result.stderr.decode("utf-8", "replace")
+    return result
+
+
+def _parse_head_branch(ref_names: str) -> str:
+    """Get the checked out branch from git's %D ref names, or "HEAD" if detached."""
+    for ref in ref_names.split(","):
+        ref = ref.strip()
+        if ref.startswith("HEAD -> "):
+            return ref[len("HEAD -> "):]
+    return "HEAD"
+
+
+def _git_head_key(git_dir: Path) -> Optional[tuple]:
+    """Get a key that changes whenever HEAD moves, or None if it can't be read."""
+    try:
+        head_mtime = (git_dir / "HEAD").stat().st_mtime_ns
+    except OSError:
+        return None
+    # HEAD itself isn't rewritten by a pull or a same-branch checkout, but the
+    # reflog is appended to on every HEAD update
+    try:
+        reflog_mtime = (git_dir / "logs" / "HEAD").stat().st_mtime_ns
+    except OSError:
+        return None
+    return head_mtime, reflog_mtime
+
+
+def _format_relative_date(seconds: float) -> str:
+    """Format an age in seconds like git's --date=relative."""
+    def ago(count, unit):
+        return f"{count} {unit}{'' if count == 1 else 's'} ago"
+    
+    seconds = max(0, int(seconds))
+    if seconds < 90:
+        return ago(seconds, "second")
+    minutes = (seconds + 30) // 60
+    if minutes < 90:
+        return ago(minutes, "minute")
+    hours = (minutes + 30) // 60
+    if hours < 36:
+        return ago(hours, "hour")
+    days = (hours + 12) // 24
+    if days < 14:
+        return ago(days, "day")
+    if days < 70:
+        return ago((days + 3) // 7, "week")
+    if days < 365:
+        return ago((days + 15) // 30, "month")
+    if days < 1825:
+        total_months = (days * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return f"{'1 year' if years == 1 else f'{years} years'}, {ago(months, 'month')}"
+        return ago(years, "year")
+    return ago((days + 183) // 365, "year")
+
+
 def check_installation(blender_version: str = "5.0", custom_path: str = "") -> Dict[str, Any]:
     """Check if scripting_nodes is installed and get current status."""
-    addon_path = get_addon_path(blender_version, custom_path)
     addons_path = get_blender_addons_path(blender_version, custom_path)
+    addon_path = addons_path / ADDON_FOLDER_NAME
     
     result = {
         "installed": False,
@@ -91,66 +252,348 @@ def check_installation(blender_version: str = "5.0", custom_path: str = "") -> D
     
     # Check if it's a git repo and get branch info
     git_dir = addon_path / ".git"
-    if git_dir.exists():
+    if _GIT is not None and git_dir.exists():
+        # Only ask git again once HEAD has moved, otherwise just re-age the commit time
+        head_key = _git_head_key(git_dir)
+        cached = _status_cache.get(str(addon_path))
+        if head_key is not None and cached is not None and cached[0] == head_key:
+            _, result["branch"], commit_time = cached
+            result["lastUpdated"] = _format_relative_date(time.time() - commit_time)
+            return result
+        
         try:
-            # Get current branch
-            branch_result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=str(addon_path),
-                capture_output=True,
-                text=True
-            )
-            if branch_result.returncode == 0:
-                result["branch"] = branch_result.stdout.strip()
-            
-            # Get last commit date
-            date_result = subprocess.run(
-                ["git", "log", "-1", "--format=%cd", "--date=relative"],
-                cwd=str(addon_path),
-                capture_output=True,
-                text=True
-            )
-            if date_result.returncode == 0:
-                result["lastUpdated"] = date_result.stdout.strip()
+            # Get current branch (from the ref names) and last commit time in one call
+            log_result = _run_git(["log", "-1", "--format=%D%n%ct", "HEAD"], addon_path)
+            if log_result.returncode == 0:
+                lines = log_result.stdout.strip().split("\n")
+                result["branch"] = _parse_head_branch(lines[0])
+                if len(lines) > 1:
+                    commit_time = int(lines[1])
+                    result["lastUpdated"] = _format_relative_date(time.time() - commit_time)
+                    if head_key is not None:
+                        _status_cache[str(addon_path)] = (head_key, result["branch"], commit_time)
         except Exception:
             pass
     else:
-        # Not a git repo, check modification time
+        # Not a git repo (or no git to ask), check modification time
         result["lastUpdated"] = datetime.fromtimestamp(addon_path.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
     
     return result
 
 
+def get_branches_cache_path() -> Path:
+    """Get the cached branches response file path."""
+    return get_settings_path().parent / BRANCHES_CACHE_FILE
+
+
+def _load_branches_cache() -> Dict[str, Any]:
+    """Load the last branches response and its ETag, if any."""
+    try:
+        with open(get_branches_cache_path(), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_branches_cache(etag: str, branches: List[Dict[str, str]]) -> None:
+    """Store the branches response alongside its ETag."""
+    # A 304 would keep serving missing dates until a branch moves, so only
+    # cache a response where every commit lookup succeeded
+    if any(branch["lastCommit"] is None for branch in branches):
+        return
+    
+    cache_path = get_branches_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({
+                "etag": etag,
+                "body": branches,
+                "fetched_at": datetime.now().isoformat()
+            }, f)
+    except OSError:
+        pass
+
+
+def _read_json(response) -> Any:
+    """Parse a JSON HTTP response body, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(response.read())
+    # json.load accepts the binary stream directly, no intermediate str
+    return json.load(response)
+
+
+def _build_github_opener() -> urllib.request.OpenerDirector:
+    """Build a URL opener with the headers GitHub's API expects."""
+    opener = urllib.request.build_opener()
+    opener.addheaders = list(GITHUB_HEADERS.items())
+    return opener
+
+
+def _get_thread_connection(local: threading.local, host: str, connections: list) -> http.client.HTTPSConnection:
+    """Get this thread's keep-alive connection to host, opening it on first use."""
+    conn = getattr(local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(host, timeout=10)
+        local.conn = conn
+        connections.append(conn)
+    return conn
+
+
+def _loads_json(body: bytes) -> Any:
+    """Parse a JSON body that's already been read, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _parse_commit_date(commit_data: Dict[str, Any]) -> str:
+    """Get the committer date from a GitHub commit response as YYYY-MM-DD."""
+    commit_date = commit_data["commit"]["committer"]["date"]
+    # Parse ISO date
+    dt = datetime.fromisoformat(commit_date.replace("Z", "+00:00"))
+    return dt.strftime("%Y-%m-%d")
+
+
+def _fetch_commit_date_opener(opener: urllib.request.OpenerDirector, name: str, commit_url: str) -> tuple:
+    """Fetch the last commit date for a branch through urllib, returning (name, date)."""
+    try:
+        with opener.open(commit_url, timeout=10) as commit_response:
+            return name, _parse_commit_date(_read_json(commit_response))
+    except Exception:
+        return name, None
+
+
+def _fetch_commit_date(local: threading.local, connections: list, opener: urllib.request.OpenerDirector,
+                       name: str, commit_url: str) -> tuple:
+    """Fetch the last commit date for a branch over this thread's connection, returning (name, date)."""
+    url = urllib.parse.urlsplit(commit_url)
+    path = f"{url.path}?{url.query}" if url.query else url.path
+    
+    # Retry once on a fresh connection if the server closed the kept-alive one
+    for attempt in range(2):
+        conn = _get_thread_connection(local, url.netloc, connections)
+        try:
+            conn.request("GET", path, headers=GITHUB_HEADERS)
+            commit_response = conn.getresponse()
+            # Read the body either way so the connection can be reused
+            body = commit_response.read()
+        except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            local.conn = None
+            continue
+        except (OSError, http.client.HTTPException):
+            # Drop the broken connection, the next lookup on this thread reconnects
+            conn.close()
+            local.conn = None
+            return name, None
+        
+        # Moved (e.g. renamed repo), let urllib follow the redirect
+        if commit_response.status in (301, 302, 303, 307, 308):
+            return _fetch_commit_date_opener(opener, name, commit_url)
+        if commit_response.status != 200:
+            return name, None
+        try:
+            return name, _parse_commit_date(_loads_json(body))
+        except Exception:
+            return name, None
+    
+    return name, None
+
+
+BRANCHES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name target { ... on Commit { committedDate } } }
+    }
+  }
+}
+"""
+
+
+def _fetch_branches_graphql(token: str) -> List[Dict[str, str]]:
+    """Fetch all branches and their last commit dates with a single GraphQL query."""
+    owner, name = GITHUB_REPO.split("/", 1)
+    opener = _build_github_opener()
+    opener.addheaders.append(("Authorization", f"bearer {token}"))
+    
+    branches = []
+    cursor = None
+    while True:
+        payload = json.dumps({
+            "query": BRANCHES_QUERY,
+            "variables": {"owner": owner, "name": name, "cursor": cursor}
+        }).encode()
+        req = urllib.request.Request(
+            GITHUB_GRAPHQL_URL, data=payload, headers={"Content-Type": "application/json"}
+        )
+        with opener.open(req, timeout=10) as response:
+            data = _read_json(response)
+        
+        if data.get("errors"):
+            raise Exception(data["errors"][0].get("message", "GraphQL query failed"))
+        
+        refs = data["data"]["repository"]["refs"]
+        for node in refs["nodes"]:
+            commit_date = (node.get("target") or {}).get("committedDate")
+            last_commit = None
+            if commit_date:
+                dt = datetime.fromisoformat(commit_date.replace("Z", "+00:00"))
+                last_commit = dt.strftime("%Y-%m-%d")
+            branches.append({"name": node["name"], "lastCommit": last_commit})
+        
+        if not refs["pageInfo"]["hasNextPage"]:
+            return branches
+        cursor = refs["pageInfo"]["endCursor"]
+
+
 def fetch_branches() -> List[Dict[str, str]]:
     """Fetch available branches from GitHub."""
+    # GraphQL needs auth, so only use it when a token is available
+    token = os.environ.get("GITHUB_TOKEN", "")
+    if token:
+        try:
+            return _fetch_branches_graphql(token)
+        except Exception:
+            pass
+    
+    return _fetch_branches_rest()
+
+
+def _conditional_headers(cache: Dict[str, Any]) -> Dict[str, str]:
+    """Get the If-None-Match header for the cached branches response, if there is one."""
+    # Conditional request: a 304 has no body and doesn't count against the rate limit
+    if cache.get("etag") and "body" in cache:
+        return {"If-None-Match": cache["etag"]}
+    return {}
+
+
+def _can_look_up_commits(remaining: Optional[str], branch_count: int) -> bool:
+    """Check there's enough rate limit left for one commit lookup per branch."""
+    return remaining is None or int(remaining) >= branch_count + RATE_LIMIT_RESERVE
+
+
+async def _read_json_async(response) -> Any:
+    """Parse a JSON aiohttp response body, using orjson when it's installed."""
+    return _loads_json(await response.read())
+
+
+async def _fetch_commit_date_async(session, name: str, commit_url: str) -> tuple:
+    """Fetch the last commit date for a branch, returning (name, date)."""
+    try:
+        async with session.get(commit_url) as commit_response:
+            commit_response.raise_for_status()
+            commit_data = await _read_json_async(commit_response)
+        return name, _parse_commit_date(commit_data)
+    except Exception:
+        return name, None
+
+
+async def fetch_branches_async() -> List[Dict[str, str]]:
+    """Fetch available branches from GitHub, for callers already running an event loop (needs aiohttp)."""
+    if aiohttp is None:
+        raise Exception("fetch_branches_async requires aiohttp, use fetch_branches instead")
+    
     url = f"{GITHUB_API_BASE}/repos/{GITHUB_REPO}/branches"
+    cache = _load_branches_cache()
+    headers = _conditional_headers(cache)
     
+    # One session for every sub-request, its connector keeps the TLS connections alive
+    connector = aiohttp.TCPConnector(limit=MAX_FETCH_WORKERS)
+    timeout = aiohttp.ClientTimeout(total=10)
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "SerpensDevManager/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
+        async with aiohttp.ClientSession(
+            headers=GITHUB_HEADERS, connector=connector, timeout=timeout, trust_env=True
+        ) as session:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return cache["body"]
+                response.raise_for_status()
+                data = await _read_json_async(response)
+                etag = response.headers.get("ETag")
+                remaining = response.headers.get("X-RateLimit-Remaining")
             
-        branches = []
-        for branch in data:
-            branch_info = {
-                "name": branch["name"],
-                "lastCommit": None
-            }
+            branches = [{"name": branch["name"], "lastCommit": None} for branch in data]
+            if not branches:
+                return branches
             
-            # Get last commit info
-            commit_url = branch["commit"]["url"]
-            try:
-                commit_req = urllib.request.Request(commit_url, headers={"User-Agent": "SerpensDevManager/1.0"})
-                with urllib.request.urlopen(commit_req, timeout=10) as commit_response:
-                    commit_data = json.loads(commit_response.read().decode())
-                    commit_date = commit_data["commit"]["committer"]["date"]
-                    # Parse ISO date
-                    dt = datetime.fromisoformat(commit_date.replace("Z", "+00:00"))
-                    branch_info["lastCommit"] = dt.strftime("%Y-%m-%d")
-            except Exception:
-                pass
+            # Not enough rate limit left for the per-branch lookups, return names only
+            if not _can_look_up_commits(remaining, len(data)):
+                return branches
             
-            branches.append(branch_info)
+            by_name = {branch["name"]: branch for branch in branches}
+            results = await asyncio.gather(*(
+                _fetch_commit_date_async(session, branch["name"], branch["commit"]["url"])
+                for branch in data
+            ))
+            for name, commit_date in results:
+                by_name[name]["lastCommit"] = commit_date
+        
+        if etag:
+            _save_branches_cache(etag, branches)
+        
+        return branches
+    except aiohttp.ClientError as e:
+        raise Exception(f"Network error: {e}")
+    except Exception as e:
+        raise Exception(f"Failed to fetch branches: {e}")
+
+
+def _fetch_branches_rest() -> List[Dict[str, str]]:
+    """Fetch branches over the REST API, looking up commit dates on a thread pool."""
+    url = f"{GITHUB_API_BASE}/repos/{GITHUB_REPO}/branches"
+    opener = _build_github_opener()
+    
+    cache = _load_branches_cache()
+    req = urllib.request.Request(url, headers=_conditional_headers(cache))
+    
+    try:
+        try:
+            with opener.open(req, timeout=10) as response:
+                data = _read_json(response)
+                etag = response.headers.get("ETag")
+                remaining = response.headers.get("X-RateLimit-Remaining")
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return cache["body"]
+            raise
+        
+        branches = [{"name": branch["name"], "lastCommit": None} for branch in data]
+        if not branches:
+            return branches
+        
+        # Not enough rate limit left for the per-branch lookups, return names only
+        if not _can_look_up_commits(remaining, len(data)):
+            return branches
+        
+        # Look up each branch's last commit concurrently, each worker thread
+        # reusing one keep-alive connection instead of a TLS handshake per branch.
+        # http.client doesn't know about proxies, so go through urllib behind one
+        by_name = {branch["name"]: branch for branch in branches}
+        use_proxy = "https" in urllib.request.getproxies()
+        local = threading.local()
+        connections = []
+        try:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(data))) as executor:
+                futures = [
+                    executor.submit(
+                        _fetch_commit_date_opener, opener, branch["name"], branch["commit"]["url"]
+                    ) if use_proxy else executor.submit(
+                        _fetch_commit_date, local, connections, opener, branch["name"], branch["commit"]["url"]
+                    )
+                    for branch in data
+                ]
+                for future in as_completed(futures):
+                    name, commit_date = future.result()
+                    by_name[name]["lastCommit"] = commit_date
+        finally:
+            for conn in connections:
+                conn.close()
+        
+        if etag:
+            _save_branches_cache(etag, branches)
         
         return branches
     except urllib.error.URLError as e:
@@ -159,10 +602,82 @@ def fetch_branches() -> List[Dict[str, str]]:
         raise Exception(f"Failed to fetch branches: {e}")
 
 
+def _copy_file(src: str, dst: str) -> None:
+    """Copy a single file's contents using the fastest available method."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        # On Linux, let the kernel copy (and reflink on btrfs/XFS) without
+        # bouncing the data through userspace
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError:
+                pass
+            # Restart with the buffered loop from a clean state
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+        
+        buf = getattr(_copy_buffers, "buf", None)
+        if buf is None:
+            buf = _copy_buffers.buf = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buf)
+        # readinto fills the shared buffer instead of allocating a new chunk per read
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+
+
+def _is_excluded(name: str, exclude: tuple) -> bool:
+    """Check a file or folder name against glob-style exclude patterns."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in exclude)
+
+
+def _fast_copytree(src: Path, dst: Path, exclude: tuple = ()) -> None:
+    """Recursively copy a directory tree using a large copy buffer, skipping excluded names."""
+    def raise_error(error: OSError) -> None:
+        raise error
+    
+    copied_dirs = []
+    # Like shutil.copytree: follow symlinked folders and copy their contents,
+    # and fail on unreadable folders instead of silently skipping them
+    for root, dirs, files in os.walk(src, onerror=raise_error, followlinks=True):
+        rel = os.path.relpath(root, src)
+        dest_root = os.path.join(dst, rel) if rel != "." else str(dst)
+        # Never merge into an existing tree, e.g. a backup from the same second
+        os.makedirs(dest_root)
+        
+        if exclude:
+            # Prune in place so os.walk never descends into excluded folders
+            dirs[:] = [name for name in dirs if not _is_excluded(name, exclude)]
+            files = [name for name in files if not _is_excluded(name, exclude)]
+        
+        for name in files:
+            src_file = os.path.join(root, name)
+            dst_file = os.path.join(dest_root, name)
+            _copy_file(src_file, dst_file)
+            shutil.copystat(src_file, dst_file)
+        
+        copied_dirs.append((root, dest_root))
+    
+    # Apply directory metadata deepest-first, once their contents are written
+    for root, dest_root in reversed(copied_dirs):
+        shutil.copystat(root, dest_root)
+
+
 def backup_installation(blender_version: str = "5.0", custom_path: str = "") -> str:
     """Backup the current scripting_nodes installation."""
-    addon_path = get_addon_path(blender_version, custom_path)
-    backup_path = get_backup_path(blender_version, custom_path)
+    addons_path = get_blender_addons_path(blender_version, custom_path)
+    addon_path = addons_path / ADDON_FOLDER_NAME
+    backup_path = addons_path / BACKUP_FOLDER_NAME
     
     if not addon_path.exists():
         raise Exception("No installation found to backup")
@@ -174,56 +689,295 @@ def backup_installation(blender_version: str = "5.0", custom_path: str = "") ->
     # Ensure backup directory exists
     backup_path.mkdir(parents=True, exist_ok=True)
     
-    # Copy the addon folder
-    shutil.copytree(addon_path, backup_dest)
+    # Copy the addon folder, leaving out .git and bytecode which can be rebuilt
+    _fast_copytree(addon_path, backup_dest, BACKUP_EXCLUDE)
+    
+    # Remember where the install came from so restore can bring .git back
+    meta = _read_git_origin(addon_path)
+    if meta:
+        with open(backup_dest / BACKUP_META_FILE, 'w') as f:
+            json.dump(meta, f, indent=2)
     
     return str(backup_dest)
 
 
-def restore_backup(blender_version: str = "5.0", custom_path: str = "") -> bool:
-    """Restore the most recent backup."""
-    addon_path = get_addon_path(blender_version, custom_path)
-    backup_path = get_backup_path(blender_version, custom_path)
+def _read_git_origin(addon_path: Path) -> Optional[Dict[str, Any]]:
+    """Get the branch, commit SHA and partial/sparse clone setup of a git install, or None if it isn't one."""
+    if _GIT is None or not (addon_path / ".git").exists():
+        return None
+    
+    result = _run_git(["log", "-1", "--format=%D%n%H", "HEAD"], addon_path)
+    if result.returncode != 0:
+        return None
+    
+    lines = result.stdout.strip().split("\n")
+    if len(lines) < 2:
+        return None
+    meta = {"branch": _parse_head_branch(lines[0]), "commit": lines[1].strip()}
+    
+    # Blobless clones from _partial_clone need the same filter and sparse
+    # patterns on restore, or the excluded folders show up as deleted
+    result = _run_git(["config", "--get", "remote.origin.partialclonefilter"], addon_path)
+    if result.returncode == 0 and result.stdout.strip():
+        meta["filter"] = result.stdout.strip()
+    
+    result = _run_git(["config", "--bool", "core.sparseCheckout"], addon_path)
+    if result.stdout.strip() == "true":
+        try:
+            with open(addon_path / ".git" / "info" / "sparse-checkout", 'r') as f:
+                meta["sparse"] = [line.strip() for line in f if line.strip()]
+        except OSError:
+            pass
+    
+    return meta
+
+
+def _restore_git_dir(checkout_path: Path, meta: Dict[str, Any]) -> None:
+    """Recreate a shallow .git for restored files at the commit they were backed up from."""
+    branch, commit = meta["branch"], meta["commit"]
+    clone_url = f"https://github.com/{GITHUB_REPO}.git"
+    clone_filter = meta.get("filter")
+    
+    # Set up the repo like a single-branch clone (partial and sparse if the
+    # original was), then point the branch at the backed up commit without
+    # touching the restored files
+    steps = [
+        ["init", "-q"],
+        ["symbolic-ref", "HEAD", f"refs/heads/{branch}"],
+        ["remote", "add", "-t", branch, "origin", clone_url],
+    ]
+    fetch = ["fetch", "--depth=1"]
+    if clone_filter:
+        steps += [
+            ["config", "remote.origin.promisor", "true"],
+            ["config", "remote.origin.partialclonefilter", clone_filter],
+        ]
+        fetch.append(f"--filter={clone_filter}")
+    steps.append(fetch + ["origin", f"{commit}:refs/remotes/origin/{branch}"])
+    if meta.get("sparse"):
+        steps.append(["sparse-checkout", "set", "--no-cone"] + meta["sparse"])
+    steps += [
+        ["reset", "-q", commit],
+        ["branch", f"--set-upstream-to=origin/{branch}"],
+    ]
+    for args in steps:
+        result = _run_git(args, checkout_path)
+        if result.returncode != 0:
+            raise Exception(f"Could not restore git history: {result.stderr.strip()}")
+
+
+def restore_backup(blender_version: str = "5.0", custom_path: str = "", restore_git: bool = True) -> bool:
+    """Restore the most recent backup, returning False if its .git folder couldn't be re-fetched."""
+    addons_path = get_blender_addons_path(blender_version, custom_path)
+    addon_path = addons_path / ADDON_FOLDER_NAME
+    backup_path = addons_path / BACKUP_FOLDER_NAME
     
     if not backup_path.exists():
         raise Exception("No backups found")
     
-    # Find most recent backup
-    backups = sorted(backup_path.glob("scripting_nodes_*"), reverse=True)
+    # Find most recent backup, the %Y%m%d_%H%M%S suffix sorts chronologically as a string
+    with os.scandir(backup_path) as it:
+        backups = [e.name for e in it if e.name.startswith("scripting_nodes_") and e.is_dir()]
     if not backups:
         raise Exception("No backups found")
     
-    latest_backup = backups[0]
+    latest_backup = backup_path / max(backups)
+    
+    _recover_interrupted_restore(addon_path, backup_path)
+    
+    staging_path = backup_path / RESTORE_STAGING_NAME
+    previous_path = backup_path / RESTORE_PREVIOUS_NAME
+    sentinel_path = backup_path / RESTORE_SENTINEL_NAME
     
-    # Remove current installation
+    # Stage a copy next to the backups so the current install stays in place
+    # until the swap, and the backup itself is kept
+    _fast_copytree(latest_backup, staging_path, (BACKUP_META_FILE,))
+    
+    # Backups don't include .git, rebuild it in the staged copy so the restored
+    # install can still be pulled. This needs the network, so it's best-effort:
+    # the files are restored either way
+    git_restored = True
+    meta_path = latest_backup / BACKUP_META_FILE
+    if restore_git and _GIT is not None and meta_path.exists():
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if meta.get("branch") and meta["branch"] != "HEAD":
+            try:
+                _restore_git_dir(staging_path, meta)
+            except Exception:
+                git_restored = False
+                if (staging_path / ".git").exists():
+                    shutil.rmtree(staging_path / ".git", onerror=_remove_readonly)
+    
+    # Swap the staged copy in with renames on the same filesystem
+    sentinel_path.write_text(datetime.now().isoformat())
     if addon_path.exists():
-        shutil.rmtree(addon_path)
+        os.replace(addon_path, previous_path)
+    os.replace(staging_path, addon_path)
+    sentinel_path.unlink()
     
-    # Restore from backup
-    shutil.copytree(latest_backup, addon_path)
+    # The restore already succeeded, anything left here is removed by the
+    # next restore's _recover_interrupted_restore
+    if previous_path.exists():
+        try:
+            shutil.rmtree(previous_path, onerror=_remove_readonly)
+        except OSError:
+            pass
+    
+    return git_restored
+
+
+def _remove_readonly(func, path, exc_info) -> None:
+    """rmtree error handler that clears the read-only bit (git pack files on Windows) and retries."""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _recover_interrupted_restore(addon_path: Path, backup_path: Path) -> None:
+    """Put the previous install back if a restore was interrupted mid-swap."""
+    sentinel_path = backup_path / RESTORE_SENTINEL_NAME
+    staging_path = backup_path / RESTORE_STAGING_NAME
+    previous_path = backup_path / RESTORE_PREVIOUS_NAME
+    
+    if sentinel_path.exists():
+        if not addon_path.exists() and previous_path.exists():
+            os.replace(previous_path, addon_path)
+        sentinel_path.unlink()
+    
+    # Leftovers from a restore that never reached (or finished) the swap
+    for leftover in (staging_path, previous_path):
+        if leftover.exists():
+            shutil.rmtree(leftover, onerror=_remove_readonly)
+
+
+def _switch_existing_checkout(branch_name: str, addon_path: Path) -> bool:
+    """Switch an existing clone to another branch by fetching only that branch, False if there's no usable clone."""
+    if not (addon_path / ".git").exists():
+        return False
+    
+    # Make sure the repository is usable before reusing it. Past this point the
+    # clone is fine, so failures (offline, unknown branch) raise rather than
+    # letting the caller delete it
+    if _run_git(["rev-parse", "--git-dir"], addon_path).returncode != 0:
+        return False
+    
+    # Fetch first with an explicit refspec so a failed fetch leaves the remote
+    # config alone, then only track the requested branch so others are never fetched
+    steps = [
+        ["fetch", "--depth=1", "origin", f"+refs/heads/{branch_name}:refs/remotes/origin/{branch_name}"],
+        ["remote", "set-branches", "origin", branch_name],
+        ["checkout", "-f", "-B", branch_name, f"origin/{branch_name}"],
+        ["branch", f"--set-upstream-to=origin/{branch_name}"],
+        ["clean", "-ffdx"],
+    ]
+    for args in steps:
+        result = _run_git(args, addon_path)
+        if result.returncode != 0:
+            raise Exception(f"Git switch failed: {result.stderr}")
     
     return True
 
 
+def _partial_clone(branch_name: str, clone_url: str, addon_path: Path) -> Optional[str]:
+    """Clone without blobs and check out all but dev-only folders, returning git's stderr on failure."""
+    result = _run_git(
+        ["clone", "--filter=blob:none", "--depth", "1", "-b", branch_name, "--single-branch",
+         "--no-checkout", clone_url, str(addon_path)]
+    )
+    if result.returncode != 0:
+        return result.stderr
+    
+    # Trees are already local, so listing the top-level folders costs no download
+    result = _run_git(["ls-tree", "-d", "--name-only", "HEAD"], addon_path)
+    if result.returncode != 0:
+        return result.stderr
+    
+    excluded = [name for name in result.stdout.split() if name in SPARSE_EXCLUDE_DIRS]
+    if excluded:
+        patterns = ["/*"] + [f"!/{name}/" for name in excluded]
+        result = _run_git(["sparse-checkout", "set", "--no-cone"] + patterns, addon_path)
+        if result.returncode != 0:
+            return result.stderr
+    
+    # Only now are the needed blobs fetched
+    result = _run_git(["checkout", branch_name], addon_path)
+    return result.stderr if result.returncode != 0 else None
+
+
+def _install_branch_zip(branch_name: str, addon_path: Path, addons_path: Path) -> None:
+    """Install a branch from GitHub's zip archive, without git or a .git folder."""
+    branch = urllib.parse.quote(branch_name, safe="/")
+    url = f"{GITHUB_CODELOAD_BASE}/{GITHUB_REPO}/zip/refs/heads/{branch}"
+    opener = _build_github_opener()
+    
+    # Download and extract next to the addon so the final move is a rename
+    extract_dir = Path(tempfile.mkdtemp(prefix="_serpens_zip_", dir=addons_path))
+    try:
+        archive_path = extract_dir / "branch.zip"
+        try:
+            with opener.open(url, timeout=30) as response, open(archive_path, 'wb') as f:
+                shutil.copyfileobj(response, f, DOWNLOAD_BUFFER_SIZE)
+        except urllib.error.URLError as e:
+            raise Exception(f"Download failed: {e}")
+        
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(extract_dir)
+        archive_path.unlink()
+        
+        # GitHub wraps the tree in a single "<repo>-<branch>" folder
+        top_level = [entry for entry in extract_dir.iterdir() if entry.is_dir()]
+        if len(top_level) != 1:
+            raise Exception("Unexpected archive layout")
+        
+        if addon_path.exists():
+            shutil.rmtree(addon_path, onerror=_remove_readonly)
+        os.replace(top_level[0], addon_path)
+    finally:
+        shutil.rmtree(extract_dir, ignore_errors=True)
+
+
 def switch_branch(branch_name: str, blender_version: str = "5.0", custom_path: str = "") -> bool:
-    """Switch to a specific branch by cloning it."""
-    addon_path = get_addon_path(blender_version, custom_path)
+    """Switch to a specific branch, reusing the existing clone when possible."""
     addons_path = get_blender_addons_path(blender_version, custom_path)
+    addon_path = addons_path / ADDON_FOLDER_NAME
     
     # Ensure addons directory exists
     addons_path.mkdir(parents=True, exist_ok=True)
     
-    # Remove existing installation
+    # Archive installs are fastest, but can't be updated with pull_latest.
+    # They're also the only option without git
+    if _GIT is None or load_settings().get("zipInstall", False):
+        _install_branch_zip(branch_name, addon_path, addons_path)
+        return True
+    
+    # Fetch just the new branch into the existing clone, only a missing or
+    # corrupt clone falls through to a fresh clone
+    if _switch_existing_checkout(branch_name, addon_path):
+        return True
+    
+    # Missing or broken clone, remove existing installation
     if addon_path.exists():
-        shutil.rmtree(addon_path)
+        shutil.rmtree(addon_path, onerror=_remove_readonly)
     
     # Clone the specific branch
     clone_url = f"https://github.com/{GITHUB_REPO}.git"
     
-    result = subprocess.run(
-        ["git", "clone", "-b", branch_name, "--single-branch", "--depth", "1", clone_url, str(addon_path)],
-        capture_output=True,
-        text=True
+    error = _partial_clone(branch_name, clone_url, addon_path)
+    if error is None:
+        return True
+    
+    if addon_path.exists():
+        shutil.rmtree(addon_path, onerror=_remove_readonly)
+    
+    # Only retry with a plain shallow clone when git or the server lacks partial
+    # clone support, other failures (bad branch, network) would just fail again.
+    # The "Cloning into '<path>'" line is skipped since the path could match
+    messages = [line.lower() for line in error.splitlines() if not line.startswith("Cloning into")]
+    if not any(marker in line for line in messages for marker in PARTIAL_CLONE_ERRORS):
+        raise Exception(f"Git clone failed: {error}")
+    
+    result = _run_git(
+        ["clone", "-b", branch_name, "--single-branch", "--depth", "1", clone_url, str(addon_path)]
     )
     
     if result.returncode != 0:
@@ -243,12 +997,7 @@ def pull_latest(blender_version: str = "5.0", custom_path: str = "") -> bool:
     if not git_dir.exists():
         raise Exception("Not a git repository - please switch to a branch first")
     
-    result = subprocess.run(
-        ["git", "pull"],
-        cwd=str(addon_path),
-        capture_output=True,
-        text=True
-    )
+    result = _run_git(["pull"], addon_path)
     
     if result.returncode != 0:
         raise Exception(f"Git pull failed: {result.stderr}")
@@ -271,7 +1020,7 @@ def open_folder(blender_version: str = "5.0", custom_path: str = "") -> bool:
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python backend.py <command> [args]")
-        print("Commands: check, branches, backup, restore, switch <branch>, pull, open")
+        print("Commands: check, branches, backup, restore [--no-git], switch <branch>, pull, open")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -287,8 +1036,11 @@ if __name__ == "__main__":
             result = backup_installation()
             print(f"Backup created: {result}")
         elif command == "restore":
-            result = restore_backup()
-            print("Backup restored successfully")
+            result = restore_backup(restore_git="--no-git" not in sys.argv[2:])
+            if result:
+                print("Backup restored successfully")
+            else:
+                print("Backup restored, but its git history couldn't be re-fetched - switch to a branch to pull again")
         elif command == "switch" and len(sys.argv) > 2:
             result = switch_branch(sys.argv[2])
             print(f"Switched to branch: {sys.argv[2]}")